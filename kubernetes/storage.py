@@ -1,5 +1,6 @@
 import base64
 import hashlib
+import json
 import logging
 import os
 from typing import Any, Optional
@@ -93,8 +94,6 @@ class SharedConfig(KubernetesResource):
             self.add_item(key, value, request_encode=encode, stringdata=stringdata)
 
     def versioning(self):
-        import json
-
         """Handle versioning for the resource."""
         if self.config.versioned:
             keys_of_interest = ["data", "binaryData", "stringData"]
@@ -1,23 +1,25 @@
-# pylint: disable=logging-fstring-interpolation
-
 import contextvars
+import copy
 import functools
 import json
 import logging
 import os
 import re
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from importlib import import_module
 from inspect import isclass
 from pkgutil import iter_modules
-from typing import Annotated, Callable, List, Optional
+from types import GeneratorType
+from typing import Annotated, Callable, Iterator, List, Optional
 
 import jmespath
 import pydantic
 import yaml
 from box.exceptions import BoxValueError
 from kapitan.cached import args
-from kapitan.inputs.helm import HelmChart
 from kapitan.inputs.kadet import (
     BaseModel,
     BaseObj,
@@ -30,12 +32,32 @@ from kapitan.utils import prune_empty, render_jinja2_file
 
 logger = logging.getLogger(__name__)
 
+# libyaml bindings; the dumper is the C counterpart of yaml.dump's default Dumper
+try:
+    from yaml import CDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import Dumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 search_paths = args.get("search_paths") if type(args) is dict else args.search_paths
-registered_generators = contextvars.ContextVar(
-    "current registered_generators in thread", default={}
-)
+# (generator function, GeneratorParams) pairs, in registration order. Not keyed
+# by target: generator modules are imported (and register) only once per process,
+# while kapitan workers go on to compile other targets with them.
+registered_generators = []
 
-target = current_target.get()
+
+def __getattr__(name):
+    # `target` is resolved on access (PEP 562): a value captured at import time
+    # goes stale as soon as the module is reused for another target
+    if name == "target":
+        return current_target.get()
+    # helm support is only needed by generators importing charts
+    if name == "HelmChart":
+        from kapitan.inputs.helm import HelmChart
+
+        return HelmChart
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class GeneratorParams(pydantic.BaseModel):
@@ -54,6 +76,23 @@ class GeneratorParams(pydantic.BaseModel):
     global_generator: Optional[bool] = False
     activation_path: Optional[str] = None
 
+    @functools.cached_property
+    def path_keys(self) -> Optional[tuple]:
+        """The keys of `path` when it is a plain dotted path, None otherwise."""
+        return _split_path(self.path)
+
+    @functools.cached_property
+    def compiled_path(self):
+        """The compiled JMESPath expression of `path`, None when `path_keys` is used."""
+        if self.path_keys is not None or not self.path:
+            return None
+        return _compile_jmespath(self.path)
+
+    @functools.cached_property
+    def compiled_patches(self) -> tuple:
+        """The `apply_patches` templates, parsed once for all configs."""
+        return tuple(PathTemplate(path) for path in self.apply_patches or ())
+
 
 class GeneratorFunctionParams(pydantic.BaseModel):
     """
@@ -82,7 +121,6 @@ class GeneratorFunctionParams(pydantic.BaseModel):
     global_inventory: dict
 
 
-@functools.lru_cache
 def load_generators(name, path):
     """
     Loads all classes from modules in a package and adds them to the global namespace.
@@ -92,8 +130,9 @@ def load_generators(name, path):
     This allows these classes to be accessed directly by name, without needing to
     know the specific module they are defined in.
 
-    The function uses `lru_cache` to cache the results, so subsequent calls with
-    the same arguments will be faster.
+    Each package is only loaded once: `path` is normalised to the real package
+    directory, so every spelling of the same path (relative, with symlinks...)
+    hits the same cache entry.
 
     Args:
         name (str): The name of the package.
@@ -102,18 +141,28 @@ def load_generators(name, path):
     Raises:
         Exception: If an error occurs while loading a module.
     """
+    _load_package(name, os.path.realpath(os.path.dirname(path)))
 
-    package_dir = os.path.abspath(os.path.dirname(path))
+
+# cached: each package directory is only scanned and imported once per process
+@functools.lru_cache
+def _load_package(name, package_dir):
+    modules = sys.modules
     for _, module_name, _ in iter_modules([package_dir]):
         try:
-            module = import_module(f"{name}.{module_name}")
-            for attribute_name in dir(module):
-                attribute = getattr(module, attribute_name)
-                if isclass(attribute):
-                    globals()[attribute_name] = attribute
+            full_name = f"{name}.{module_name}"
+            # generator modules usually import each other (e.g. `.common`) first
+            module = modules.get(full_name) or import_module(full_name)
+            globals().update(
+                (attribute_name, attribute)
+                for attribute_name, attribute in vars(module).items()
+                if not attribute_name.startswith("_")
+                and isclass(attribute)
+                and attribute.__module__ == full_name
+            )
 
         except Exception as e:
-            logger.error(f"Error loading {module_name}: {e}")
+            logger.error("Error loading %s: %s", module_name, e)
 
 
 class DeleteContent(Exception):
@@ -144,11 +193,23 @@ def render_json(data):
 
 def render_yaml(data):
     if isinstance(data, str):
-        data = yaml.safe_load(data)
-    return yaml.dump(data, default_flow_style=False, width=1000, sort_keys=True)
+        data = yaml.load(data, Loader=_YamlLoader)
+    return yaml.dump(
+        data,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        width=1000,
+        sort_keys=True,
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _compile_jmespath(path: str):
+    """Parses a JMESPath expression once; the same few paths are searched over and over."""
+    return jmespath.compile(path)
 
 
-def findpath(obj, path: str, default={}):
+def findpath(obj, path: str, default=None):
     """
     Safely extracts a value from a JSON-like object using a JMESPath expression.
 
@@ -160,7 +221,7 @@ def findpath(obj, path: str, default={}):
         obj (dict or list): The JSON-like object to search.
         path (str): The JMESPath expression to use for searching.
         default (Any, optional): The value to return if the path is empty or
-                                 an error occurs. Defaults to None.
+                                 an error occurs. Defaults to a new empty dict.
 
     Returns:
         Any: The extracted value or the default value.
@@ -171,26 +232,143 @@ def findpath(obj, path: str, default={}):
         >>> findpath({"a": {"b": 1}}, "c.d", default=0)
         0
     """
+    if default is None:
+        default = {}  # a new dict each call: callers may fill in what they get back
+    if not path:
+        return default  # no need to go through jmespath to find nothing
+
     try:
-        value = jmespath.search(path, obj)
+        value = _compile_jmespath(path).search(obj)
     except jmespath.exceptions.EmptyExpressionError:
         return default  # Return default directly on empty expression error
 
     return value if value is not None else default
 
 
+class PathTemplate:
+    """
+    A `str.format` path template, parsed once and rendered against many mappings.
+
+    Templates only made of plain `{name}` fields are rendered with direct lookups
+    in the mapping. Anything else (positional, attribute or index fields, nested
+    format specs) is rendered with `str.format`.
+
+    Example:
+        >>> PathTemplate('applications."{application}".defaults').render({"application": "app"})
+        'applications."app".defaults'
+    """
+
+    __slots__ = ("template", "parts", "static")
+
+    _conversions = {"r": repr, "s": str, "a": ascii}
+
+    def __init__(self, template: str):
+        self.template = template
+        self.parts = None
+        self.static = None
+        try:
+            parts = tuple(string.Formatter().parse(template))
+        except ValueError:
+            return  # malformed: str.format will raise the usual error
+
+        if all(
+            field is None or (field.isidentifier() and "{" not in spec)
+            for _, field, spec, _ in parts
+        ):
+            self.parts = parts
+            if all(field is None for _, field, _, _ in parts):
+                # most patch paths have no fields at all: render them only once
+                self.static = "".join(literal for literal, _, _, _ in parts)
+
+    def render(self, mapping) -> str:
+        """
+        Renders the template, raising KeyError when a field is missing from mapping.
+        """
+        if self.static is not None:
+            return self.static
+        if self.parts is None:
+            return self.template.format(**mapping)
+
+        chunks = []
+        for literal, field, spec, conversion in self.parts:
+            chunks.append(literal)
+            if field is not None:
+                if field not in mapping:
+                    raise KeyError(field)
+                value = mapping[field]
+                if conversion:
+                    value = self._conversions[conversion](value)
+                chunks.append(format(value, spec))
+        return "".join(chunks)
+
+
+# a plain identifier, or a quoted one without escapes (e.g. "app.kubernetes.io/name")
+_PATH_SEGMENT = r'(?:[A-Za-z_][A-Za-z0-9_]*|"[^"\\]+")'
+_SIMPLE_PATH_RE = re.compile(rf"{_PATH_SEGMENT}(?:\.{_PATH_SEGMENT})*")
+_PATH_KEY_RE = re.compile(r'"([^"\\]+)"|([^."]+)')
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str):
+    """
+    Splits a plain dotted JMESPath expression (e.g. `metadata.name` or
+    `applications."my-app".defaults`) into its keys.
+
+    Returns None for anything else (escapes, indexes, filters...),
+    which must be evaluated by JMESPath.
+    """
+    if not path or not _SIMPLE_PATH_RE.fullmatch(path):
+        return None
+    if '"' not in path:
+        return tuple(path.split("."))
+    return tuple(quoted or plain for quoted, plain in _PATH_KEY_RE.findall(path))
+
+
+def _walk_path(obj, keys: tuple):
+    """
+    Follows `keys` through nested dicts, returning None as soon as one is missing.
+
+    Values are only read, so lookups use `dict.get` directly: this skips Box's
+    item access machinery and its conversion of every subtree it walks through.
+    """
+    for key in keys:
+        if not isinstance(obj, dict):
+            return None
+        obj = dict.get(obj, key)
+    return obj
+
+
+def _resolve_path(obj, keys: tuple):
+    """
+    Like `_walk_path`, but goes through each container's own `get` as JMESPath
+    does, so nested Dicts are returned as Dicts (e.g. configs handed to generators)
+    and any mapping-like object (such as a lazy inventory) can be walked.
+    """
+    for key in keys:
+        try:
+            obj = obj.get(key, None)
+        except AttributeError:
+            return None
+    return obj
+
+
 def merge(source: Dict, destination: Dict) -> Dict:
     """
-    Recursively merges two dictionaries.
+    Deep merges two dictionaries.
 
-    This function merges the `source` dictionary into the `destination` dictionary,
-    giving precedence to values in the `source` dictionary in case of conflicts.
-    It handles nested dictionaries by recursively merging them.
+    This function merges the `source` dictionary into the `destination` dictionary.
+    Values already set in the `destination` dictionary take precedence in case of
+    conflicts: `source` only fills in the keys that are missing.
+    Nested dictionaries are merged iteratively using an explicit stack, so deep
+    trees do not consume Python call frames.
 
     If a key in the `source` dictionary has a corresponding value in the
     `destination` dictionary that is an empty dictionary, the value from the
     `source` dictionary is ignored (this allows for intentional overriding).
 
+    Subtrees missing from `destination` are copied in, so later merges into the
+    result never write back into `source`.
+
     Args:
         source (Dict): The source dictionary to merge from.
         destination (Dict): The destination dictionary to merge into.
@@ -198,22 +376,60 @@ def merge(source: Dict, destination: Dict) -> Dict:
     Returns:
         Dict: The merged dictionary.
     """
-    for key, value in source.items():
-        if isinstance(value, dict):
-            node = destination.get(key, None)
-            if node is None:
-                destination[key] = value
-            elif len(node) == 0:
-                # node is set to an empty dict on purpose as a way to override the value
-                pass
-            else:
-                merge(value, node)
-        else:
-            destination[key] = destination.setdefault(key, value)
+    stack = [(source, destination)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict):
+                node = dst.get(key, None)
+                if node is None:
+                    dst[key] = copy.deepcopy(value)
+                elif len(node) == 0:
+                    # node is set to an empty dict on purpose as a way to override the value
+                    pass
+                else:
+                    stack.append((value, node))
+            elif key not in dst:
+                dst[key] = value
 
     return destination
 
 
+def _is_prunable(value) -> bool:
+    return value is None or (isinstance(value, (dict, list)) and not value)
+
+
+def prune_in_place(node: Dict) -> None:
+    """
+    Removes None values, empty dicts and empty lists nested in `node`.
+
+    Follows the same rules as `kapitan.utils.prune_empty`, where a container is
+    dropped only if it was already empty before its own children were pruned.
+    Nested dicts are pruned in place instead of being rebuilt. Lists are replaced
+    by pruned copies: Box shares list values with the data they were assigned
+    from (e.g. the inventory), which must not be modified.
+
+    Args:
+        node (Dict): The dictionary to prune.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        lists = []
+        for key, value in node.items():
+            if _is_prunable(value):
+                lists.append((key, None))
+            elif isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, list):
+                lists.append((key, value))
+        for key, value in lists:
+            if value is None:
+                del node[key]
+            else:
+                node[key] = prune_empty(value)
+
+
 def patch_config(config: Dict, inventory: Dict, inventory_path: str) -> None:
     """
     Applies a patch to a configuration.
@@ -227,40 +443,33 @@ def patch_config(config: Dict, inventory: Dict, inventory_path: str) -> None:
         inventory (Dict): The inventory dictionary containing the patch.
         inventory_path (str): The JMESPath expression to locate the patch in the inventory.
     """
-    patch = findpath(inventory, inventory_path, {})
-    logger.debug(f"Applying patch {inventory_path} : {patch}")
-    merge(patch, config)
+    keys = _split_path(inventory_path)
+    if keys is not None:
+        patch = _resolve_path(inventory, keys) or {}
+    else:
+        patch = findpath(inventory, inventory_path, {})
+    logger.debug("Applying patch %s : %s", inventory_path, patch)
+    if patch:
+        merge(patch, config)
 
 
 def register_function(func: Callable, params: GeneratorParams):
     """
-    Registers a function with its associated parameters for a specific target.
+    Registers a function with its associated parameters.
 
-    This function takes a function and its parameters, retrieves the current target
-    from a context variable, and stores the function-parameter pair in a dictionary
-    associated with that target. This dictionary is also stored in a context variable.
+    This function takes a function and its parameters and appends the
+    function-parameter pair to the `registered_generators` list. Registered
+    generators run for every target compiled with this module.
 
     Args:
         func (Callable): The function to register.
         params (GeneratorParams): The parameters associated with the function.
     """
-    target = current_target.get()
+    logger.debug("Registering function %s with params %s", func.__name__, params)
 
-    logger.debug(
-        f"Registering function {func.__name__} with params {params} for target {target}"
-    )
-
-    generator_dict = registered_generators.get()
-    generator_list = generator_dict.setdefault(
-        target, []
-    )  # Use setdefault for cleaner initialization
-    generator_list.append((func, params))
-
-    logger.debug(
-        f"Currently registered {len(generator_list)} functions for target {target}"
-    )
+    registered_generators.append((func, params))
 
-    registered_generators.set(generator_dict)
+    logger.debug("Currently registered %d functions", len(registered_generators))
 
 
 def register_generator(*args, **kwargs):
@@ -332,29 +541,131 @@ MutationCondition = Annotated[
 ]
 
 
-class RegExpMatchMutationSpec(BaseModel):
-    patch: dict
+def _compile_conditions(conditions: MutationCondition) -> tuple:
+    """
+    Turns mutation conditions into a tuple of (keys, expression, frozenset(values)).
+
+    Plain dotted paths are split into `keys` and walked directly, anything else
+    is kept as a compiled JMESPath `expression`.
+    A wildcard matches straight away without looking at the conditions after
+    it, so the compiled form stops at the first wildcard.
+    """
+    compiled = []
+    for path, values in conditions.items():
+        if "*" in values:
+            break
+        keys = _split_path(path)
+        expression = None
+        if keys is None:
+            try:
+                expression = _compile_jmespath(path)
+            except jmespath.exceptions.EmptyExpressionError:
+                pass  # an empty path never matches
+        compiled.append((keys, expression, frozenset(values)))
+    return tuple(compiled)
+
+
+class MutationSpec(BaseModel):
     conditions: MutationCondition
 
+    @functools.cached_property
+    def compiled_conditions(self) -> tuple:
+        return _compile_conditions(self.conditions)
 
-class PatchMutationSpec(BaseModel):
+
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]()|\\]")
+
+
+class _LiteralPattern:
+    """A compiled pattern stand-in for patterns without metacharacters."""
+
+    __slots__ = ("literal",)
+
+    def __init__(self, literal: str):
+        self.literal = literal
+
+    def sub(self, replacement: str, string: str) -> str:
+        return string.replace(self.literal, replacement)
+
+
+def _compile_pattern(pattern: str, replacement: str):
+    if pattern and not _REGEX_META_RE.search(pattern) and "\\" not in replacement:
+        # a plain string swap: no need to go through the regex engine
+        return _LiteralPattern(pattern)
+    return re.compile(pattern)
+
+
+def compile_regex_patch(patch: dict) -> tuple:
+    """Returns the (compiled pattern, replacement) pairs of a regex_patch mapping."""
+    if not isinstance(patch, dict):
+        raise CompileError(
+            "Expected dict[pattern: str, replacement: str] for regex_patch"
+        )
+    return tuple(
+        (_compile_pattern(pattern, replacement), replacement)
+        for pattern, replacement in patch.items()
+    )
+
+
+def _regex_sub_copy(value, substitutions: tuple):
+    """Returns a copy of `value` with `substitutions` applied to its strings."""
+    if isinstance(value, str):
+        for pattern, replacement in substitutions:
+            value = pattern.sub(replacement, value)
+        return value
+    if isinstance(value, dict):
+        return {k: _regex_sub_copy(v, substitutions) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_regex_sub_copy(v, substitutions) for v in value]
+    return value
+
+
+def _regex_sub_values(node: Dict, substitutions: tuple) -> None:
+    """
+    Applies `substitutions` to every string value nested in `node`.
+
+    Nested dicts are updated in place. Lists are replaced by substituted copies,
+    as Box shares them with the data they were assigned from (see `prune_in_place`).
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for key, value in list(node.items()):
+            if isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, (str, list)):
+                node[key] = _regex_sub_copy(value, substitutions)
+
+
+class RegExpMatchMutationSpec(MutationSpec):
     patch: dict
-    conditions: MutationCondition
+    values_only: bool = False
 
+    @functools.cached_property
+    def compiled_patch(self) -> tuple:
+        return compile_regex_patch(self.patch)
 
-class BundleMutationSpec(BaseModel):
+
+class PatchMutationSpec(MutationSpec):
+    patch: dict
+
+
+class BundleMutationSpec(MutationSpec):
     filename: str
-    conditions: MutationCondition
     break_: bool = pydantic.Field(alias="break", default=True)
 
+    @functools.cached_property
+    def is_template(self) -> bool:
+        """Whether `filename` needs formatting with the content (e.g. "{content.metadata.name}")."""
+        return "{" in self.filename or "}" in self.filename
 
-class DeleteMutationSpec(BaseModel):
-    conditions: MutationCondition
+
+class DeleteMutationSpec(MutationSpec):
+    pass
 
 
-class PruneMutationSpec(BaseModel):
+class PruneMutationSpec(MutationSpec):
     prune: bool = True
-    conditions: MutationCondition
     break_: bool = pydantic.Field(alias="break", default=True)
 
 
@@ -383,191 +694,331 @@ class BaseContent(GeneratorClass):
 
     def dump(self):
         if self.prune:
-            self.root = Dict(prune_empty(self.root))
+            prune_in_place(self.root)
         return super().dump()
 
     @classmethod
     def from_baseobj(cls, baseobj: BaseObj):
         """Return a BaseContent initialised with baseobj."""
-        return cls.from_dict(baseobj.root)
+        # baseobj.root is already a Dict: adopt it instead of deep-converting a copy
+        if baseobj.root:
+            obj = cls()
+            obj.parse(baseobj.root)
+            return obj
 
     @classmethod
-    def from_yaml(cls, file_path) -> List:
-        """Returns a list of BaseContent initialised with the content of file_path data."""
+    def from_yaml(cls, file_path) -> Iterator["BaseContent"]:
+        """Yields a BaseContent initialised with each document of file_path data."""
 
-        content_list = list()
-        with open(file_path) as fp:
-            yaml_objs = yaml.safe_load_all(fp)
-            for yaml_obj in yaml_objs:
-                if yaml_obj:
-                    content_list.append(BaseContent.from_dict(yaml_obj))
-
-        return content_list
+        with open(file_path, "rb") as fp:
+            data = fp.read()
+        for yaml_obj in yaml.load_all(data, Loader=_YamlLoader):
+            if yaml_obj:
+                yield BaseContent.from_dict(yaml_obj)
 
     @classmethod
     def from_dict(cls, dict_value):
         """Return a BaseContent initialised with dict_value."""
 
         if dict_value:
+            # always copied: dict_value may be inventory data, and dump prunes in place
             try:
-                obj = cls()
-                obj.parse(Dict(dict_value))
-                return obj
+                content = Dict(dict_value)
             except BoxValueError as e:
                 raise CompileError(
                     f"error when importing item '{dict_value}' of type {type(dict_value)}: {e}"
                 )
+            obj = cls()
+            obj.parse(content)
+            return obj
 
     def parse(self, content: Dict):
         self.root = content
 
     @staticmethod
     def findpath(obj, path):
-        return findpath(obj, path)
+        keys = _split_path(path)
+        if keys is None:
+            return findpath(obj, path)
+        value = _walk_path(obj, keys)
+        return value if value is not None else {}
+
+    @staticmethod
+    def prepare_mutations(mutations) -> ContentMutateSpec:
+        """
+        Validates mutations once, to be passed to `mutate` for many contents.
+
+        Raises:
+            CompileError: if the mutations are invalid.
+        """
+        if isinstance(mutations, ContentMutateSpec):
+            return mutations
+        try:
+            return ContentMutateSpec.model_validate(mutations)
+        except pydantic.ValidationError as e:
+            raise CompileError(f"Invalid mutations {mutations}: {e}")
 
     def mutate(self, mutations: ContentMutateSpec):
-        mutations = ContentMutateSpec.model_validate(mutations)
+        """
+        Applies mutations to the content.
+
+        Raw dicts are validated on each call: when mutating many contents, pass
+        the result of `prepare_mutations` instead (as BaseStore.process_mutations does).
+        """
+        mutations = self.prepare_mutations(mutations)
+        # actions without conditions (or starting with a wildcard) compile to an
+        # empty tuple and always apply: only the others are matched against root
+        matches = self._match_compiled
         for action in mutations.patch:
-            if self.match(action.conditions):
+            if not action.compiled_conditions or matches(action.compiled_conditions):
                 self.patch(action.patch)
 
+        # matching regex actions are batched so the content is dumped and
+        # re-parsed once, not once per action; runs with the same mode are joined
+        regex_batches = []
         for action in mutations.regex_patch:
-            if self.match(action.conditions):
-                self.regex_patch(action.patch)
+            if not action.compiled_conditions or matches(action.compiled_conditions):
+                if regex_batches and regex_batches[-1][0] == action.values_only:
+                    regex_batches[-1][1].extend(action.compiled_patch)
+                else:
+                    regex_batches.append(
+                        (action.values_only, list(action.compiled_patch))
+                    )
+        for values_only, substitutions in regex_batches:
+            self.regex_patch(tuple(substitutions), values_only=values_only)
 
         for action in mutations.delete:
-            if self.match(action.conditions):
+            if not action.compiled_conditions or matches(action.compiled_conditions):
                 raise DeleteContent(f"Deleting {self} because of {action.conditions}")
 
         for action in mutations.prune:
-            if self.match(action.conditions):
+            if not action.compiled_conditions or matches(action.compiled_conditions):
                 self.prune = action.prune
                 if action.break_:
                     break
         for action in mutations.bundle:
-            if self.match(action.conditions):
-                try:
-                    self.filename = action.filename.format(content=self)
-                except (AttributeError, KeyError):
-                    pass
+            if not action.compiled_conditions or matches(action.compiled_conditions):
+                if action.is_template:
+                    try:
+                        self.filename = action.filename.format(content=self)
+                    except (AttributeError, KeyError):
+                        pass
+                else:
+                    self.filename = action.filename
                 if action.break_:
                     break
 
     def match(self, match_conditions):
-        for key, values in match_conditions.items():
-            if "*" in values:
-                return True
-            value = self.findpath(self.root, key)
-            if value in values:
-                continue
+        return self._match_compiled(_compile_conditions(match_conditions))
+
+    def _match_compiled(self, conditions: tuple) -> bool:
+        root = self.root
+        for keys, expression, values in conditions:
+            if keys is not None:
+                value = _walk_path(root, keys)
+            elif expression is not None:
+                value = expression.search(root)
             else:
                 return False
+            try:
+                if value not in values:
+                    return False
+            except TypeError:
+                # unhashable values (dicts, lists) can never match a list of strings
+                return False
         return True
 
     def patch(self, patch):
+        if not any(isinstance(value, (dict, list)) for value in patch.values()):
+            # only top level scalars: nothing to merge recursively or extend
+            self.root.update(patch)
+            return
+
         self.root.merge_update(Dict(patch), box_merge_lists="extend")
 
-    def regex_patch(self, patch):
-        if not isinstance(patch, dict):
-            raise CompileError(
-                "Expected dict[pattern: str, replacement: str] for regex_patch"
-            )
-        yaml_dump: str = yaml.dump(self.dump())
-        for pattern, replacement in patch.items():
-            yaml_dump = re.sub(pattern, replacement, yaml_dump)
+    def regex_patch(self, patch, values_only: bool = False):
+        """
+        Applies regex substitutions to the YAML representation of the content.
+
+        Args:
+            patch: a dict of pattern -> replacement, or the output of
+                `compile_regex_patch` when the same patch is applied to many contents.
+            values_only (bool): only substitute inside string values, in place.
+                This avoids dumping and re-parsing the whole content as YAML,
+                but patterns cannot match keys or span several lines.
+        """
+        if isinstance(patch, tuple):
+            substitutions = patch
+        else:
+            substitutions = compile_regex_patch(patch)
+
+        if values_only:
+            _regex_sub_values(self.root, substitutions)
+            return
 
-        patched_dict = yaml.safe_load(yaml_dump)
+        yaml_dump: str = yaml.dump(self.dump(), Dumper=_YamlDumper)
+        for pattern, replacement in substitutions:
+            yaml_dump = pattern.sub(replacement, yaml_dump)
+
+        patched_dict = yaml.load(yaml_dump, Loader=_YamlLoader)
         self.parse(Dict(patched_dict))
 
 
+def _content_key(content) -> Optional[tuple]:
+    """
+    Returns a hashable key shared by all contents that can compare equal.
+
+    Contents compare equal on their whole root, or on their kind and name
+    (e.g. Kubernetes resources), so both are always part of what makes them equal.
+    Returns None when kind or name is unhashable, which puts all such contents
+    into one bucket.
+    """
+    root = getattr(content, "root", None)
+    key = (_walk_path(root, ("kind",)), _walk_path(root, ("metadata", "name")))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 class BaseStore(GeneratorClass):
-    content_list: List[BaseContent] = []
+    content_list: List[BaseContent] = pydantic.Field(default_factory=list)
 
     @classmethod
     def from_yaml_file(cls, file_path):
         store = cls()
-        with open(file_path) as fp:
-            basename = os.path.basename(file_path)
-            filename = os.path.splitext(basename)[0]
-            yaml_objs = yaml.safe_load_all(fp)
-            for yaml_obj in yaml_objs:
-                if yaml_obj:
-                    content = BaseContent.from_dict(yaml_obj)
-                    content.filename = filename
-                    store.add(content)
+        # one read, and bytes let the C parser decode the stream itself
+        with open(file_path, "rb") as fp:
+            data = fp.read()
+        basename = os.path.basename(file_path)
+        filename = os.path.splitext(basename)[0]
+        for yaml_obj in yaml.load_all(data, Loader=_YamlLoader):
+            if yaml_obj:
+                content = BaseContent.from_dict(yaml_obj)
+                content.filename = filename
+                store.add(content)
         return store
 
     def add(self, object):
-        logger.debug(f"Adding {type(object)} to store")
-        if isinstance(object, BaseContent):
-            self.content_list.append(object)
-        elif isinstance(object, BaseStore):
-            self.content_list.extend(object.content_list)
-
-        elif isinstance(object, list):
-            for item in object:
-                if isinstance(item, BaseObj):
-                    self.add(BaseContent.from_baseobj(item))
-                else:
-                    self.add_list(item)
-
-        elif isinstance(object, BaseObj):
-            self.add(BaseContent.from_baseobj(object))
-
-        else:
-            self.content_list.append(object)
+        logger.debug("Adding %s to store", type(object))
+        _add_to_store(object, self)
 
     def add_list(self, contents: List[BaseContent]):
+        add = self.add
         for content in contents:
-            self.add(content)
+            add(content)
 
     def import_from_helm_chart(self, **kwargs):
-        self.add_list(
-            [
-                BaseContent.from_baseobj(resource)
-                for resource in HelmChart(**kwargs).root.values()
-            ]
+        from kapitan.inputs.helm import HelmChart
+
+        # append contents directly instead of dispatching each one through add();
+        # from_baseobj returns None for resources with an empty root
+        contents = (
+            BaseContent.from_baseobj(resource)
+            for resource in HelmChart(**kwargs).root.values()
         )
+        self.content_list.extend(content for content in contents if content is not None)
 
     def apply_patch(self, patch: Dict):
-        for content in self.get_content_list():
+        for content in self.content_list:
             content.patch(patch)
 
     def process_mutations(self, mutations: Dict):
-        for content in self.get_content_list():
+        if not mutations:
+            return
+
+        # validate once so that compiled conditions are shared by all contents
+        mutations = BaseContent.prepare_mutations(mutations)
+
+        kept = []
+        for content in self.content_list:
             try:
                 content.mutate(mutations)
             except DeleteContent as e:
                 logger.debug(e)
-                self.content_list.remove(content)
-            except:
-                raise CompileError(f"Error when processing mutations on {content}")
+                continue
+            except Exception as e:
+                raise CompileError(
+                    f"Error when processing mutations on {content}"
+                ) from e
+            kept.append(content)
+
+        self.content_list[:] = kept
 
     def get_content_list(self):
         return getattr(self, "content_list", [])
 
     def dump(self, output_filename=None, already_processed=False):
         """Return object dict/list."""
-        logger.debug(f"Dumping {len(self.get_content_list())} items")
+        logger.debug("Dumping %d items", len(self.content_list))
         if not already_processed:
-            for content in self.get_content_list():
-                if output_filename:
-                    output_format = output_filename
+            root = self.root
+            # filename -> (its list in root, {content key: contents}), so that
+            # duplicates are only looked for among contents that could compare equal
+            files = {}
+            for content in self.content_list:
+                output_format = output_filename or getattr(
+                    content, "filename", "output"
+                )
+                if "{" in output_format or "}" in output_format:
+                    filename = output_format.format(content=content)
                 else:
-                    output_format = getattr(content, "filename", "output")
-                filename = output_format.format(content=content)
-                file_content_list = self.root.get(filename, [])
-                if content in file_content_list:
+                    # plain filenames are by far the most common case
+                    filename = output_format
+                entry = files.get(filename)
+                if entry is None:
+                    file_content_list = root.setdefault(filename, [])
+                    file_buckets = {}
+                    for existing in file_content_list:
+                        file_buckets.setdefault(_content_key(existing), []).append(
+                            existing
+                        )
+                    entry = files[filename] = (file_content_list, file_buckets)
+                file_content_list, file_buckets = entry
+                bucket = file_buckets.setdefault(_content_key(content), [])
+                if content in bucket:
                     logger.debug(
-                        f"Skipping duplicated content content for reason 'Duplicate name {content.name} for {filename}'"
+                        "Skipping duplicated content content for reason 'Duplicate name %s for %s'",
+                        content.name,
+                        filename,
                     )
                     continue
 
-                self.root.setdefault(filename, []).append(content)
+                bucket.append(content)
+                file_content_list.append(content)
 
         return super().dump()
 
 
+@functools.singledispatch
+def _add_to_store(object, store: BaseStore):
+    # dispatch on type(object) is resolved once per type and cached,
+    # instead of running the isinstance chain for every added content
+    store.content_list.append(object)
+
+
+@_add_to_store.register
+def _(object: BaseContent, store: BaseStore):
+    store.content_list.append(object)
+
+
+@_add_to_store.register
+def _(object: BaseStore, store: BaseStore):
+    store.content_list.extend(object.content_list)
+
+
+@_add_to_store.register(list)
+@_add_to_store.register(GeneratorType)
+def _(object, store: BaseStore):
+    store.add_list(object)
+
+
+@_add_to_store.register
+def _(object: BaseObj, store: BaseStore):
+    store.add(BaseContent.from_baseobj(object))
+
+
 class BaseGenerator:
     """
     Base class for generating configurations based on an inventory.
@@ -583,6 +1034,14 @@ class BaseGenerator:
         store (BaseStore): An instance of BaseStore to store generated configurations.
     """
 
+    __slots__ = (
+        "inventory",
+        "global_inventory",
+        "generator_defaults",
+        "store",
+        "_findpath_cache",
+    )
+
     def __init__(
         self,
         inventory: Dict,
@@ -597,30 +1056,76 @@ class BaseGenerator:
         self.global_inventory = inventory_global()
         self.generator_defaults = findpath(self.inventory, defaults_path)
         logger.debug(
-            f"Setting {self.generator_defaults} as generator defaults for {defaults_path}"
+            "Setting %s as generator defaults for %s",
+            self.generator_defaults,
+            defaults_path,
         )
 
         # Simplified store initialization
         self.store = store() if store else BaseStore()
 
-    def _apply_patches(self, config: Dict, patches: list, inventory: Dict) -> Dict:
+        # (id(obj), path) -> (obj, value); obj is kept so its id cannot be reused
+        self._findpath_cache = {}
+
+    def _findpath(
+        self, obj, path: str, default=None, keys: tuple = None, expression=None
+    ):
+        """
+        Memoized `findpath` for lookups against inventory data.
+
+        The inventory does not change while generating, so the same paths
+        (shared `apply_patches` entries, generator paths) are only resolved once
+        per inventory, whichever generator asks first.
+
+        Args:
+            obj (Dict): The object to search.
+            path (str): The JMESPath expression to use for searching.
+            default (Any, optional): The value to return if nothing is found.
+            keys (tuple, optional): The keys of `path` when it is a plain dotted
+                path, used to walk `obj` without JMESPath.
+            expression (optional): `path` already compiled with JMESPath.
+
+        Returns:
+            Any: The extracted value or the default value.
+        """
+        key = (id(obj), path)
+        cached = self._findpath_cache.get(key)
+        if cached is None:
+            if keys is not None:
+                value = _resolve_path(obj, keys)
+            elif expression is not None:
+                value = expression.search(obj)
+            else:
+                value = _compile_jmespath(path).search(obj) if path else None
+            cached = self._findpath_cache[key] = (obj, value)
+        value = cached[1]
+        return value if value is not None else default
+
+    def _apply_patches(
+        self, config: Dict, patches: List[PathTemplate], inventory: Dict
+    ) -> Dict:
         """
         Applies patches to a configuration.
 
         Args:
             config (Dict): The configuration to patch.
-            patches (list): A list of JMESPath expressions to locate patches in the inventory.
+            patches (list): Templates of JMESPath expressions to locate patches in the inventory.
             inventory (Dict): The inventory containing the patches.
 
         Returns:
             Dict: The patched configuration.
         """
+        # always a copy: generators may modify their config (e.g. pop keys),
+        # which must never write back into the inventory
         patched_config = Dict(config)
         for path in patches:
             try:
-                path = path.format(**patched_config)
-                patch = findpath(inventory.parameters, path, {})
-                patched_config = merge(patch, patched_config)
+                path = path.render(patched_config)
+                patch = self._findpath(
+                    inventory.parameters, path, {}, keys=_split_path(path)
+                )
+                if patch:
+                    merge(patch, patched_config)
             except KeyError:
                 pass  # Silently ignore missing keys
         return patched_config
@@ -632,6 +1137,7 @@ class BaseGenerator:
         generator_config: Dict,
         generator_params: GeneratorParams,
         inventory: Dict,
+        target_name: str = None,
     ) -> None:
         """
         Executes a generator function with the given configuration and parameters.
@@ -642,9 +1148,10 @@ class BaseGenerator:
             generator_config (Dict): The configuration data.
             generator_params (Dict): Additional parameters for the generator function.
             inventory (Dict): The inventory data.
+            target_name (str, optional): The current target. Defaults to `current_target`.
         """
         generator_function_params = {
-            "target": current_target.get(),
+            "target": target_name or current_target.get(),
             "id": generator_config_id,
             "name": generator_config.get("name", generator_config_id),
             "config": generator_config,
@@ -655,7 +1162,10 @@ class BaseGenerator:
             "global_inventory": self.global_inventory,
         }
         logger.debug(
-            f"Running class {generator_function.__name__} for {generator_config_id} with params {list(generator_function_params.keys())}"
+            "Running class %s for %s with params %s",
+            generator_function.__name__,
+            generator_config_id,
+            list(generator_function_params),
         )
         self.store.add(generator_function.generate(meta=generator_function_params))
 
@@ -664,6 +1174,7 @@ class BaseGenerator:
         generator_function: Callable,
         generator_params: GeneratorParams,
         inventory: Dict = None,
+        target_name: str = None,
     ) -> None:
         """
         Expands configurations based on a 'path' parameter and runs a generator function for each.
@@ -672,25 +1183,41 @@ class BaseGenerator:
             generator_function (Callable): The generator function to execute.
             generator_params (GeneratorParams): Generator parameters
             inventory (Dict, optional): The inventory to use. Defaults to self.inventory.
+            target_name (str, optional): The current target. Defaults to `current_target`.
         """
         inventory = inventory or self.inventory
-        configs = findpath(inventory.parameters, generator_params.path)
+        target_name = target_name or current_target.get()
+        # generators sharing a path (and global generators visiting the same
+        # inventories) reuse the configs found by the first one
+        configs = self._findpath(
+            inventory.parameters,
+            generator_params.path,
+            keys=generator_params.path_keys,
+            expression=generator_params.compiled_path,
+        )
 
         if configs:
             logger.debug(
-                f"Found {len(configs)} configs to generate at {generator_params.path} for target {current_target.get()}"
+                "Found %d configs to generate at %s for target %s",
+                len(configs),
+                generator_params.path,
+                target_name,
             )
+            apply_patches = self._apply_patches
+            run_generator_function = self._run_generator_function
+            patches = generator_params.compiled_patches
             for generator_config_id, generator_config in configs.items():
-                if generator_params.apply_patches:
-                    generator_config = self._apply_patches(
-                        generator_config, generator_params.apply_patches, inventory
+                if patches:
+                    generator_config = apply_patches(
+                        generator_config, patches, inventory
                     )
-                self._run_generator_function(
+                run_generator_function(
                     generator_function,
                     generator_config_id,
                     generator_config,
                     generator_params,
                     inventory,
+                    target_name,
                 )
 
     def generate(self) -> "BaseStore":
@@ -705,40 +1232,102 @@ class BaseGenerator:
         Returns:
             BaseStore: The store containing the generated configurations.
         """
-        generators = registered_generators.get().get(target, [])
+        # lookups are cached for one generation pass only: inventories may be
+        # reloaded between passes and their ids reused
+        self._findpath_cache.clear()
+
+        # resolve the target now: the module may outlive the target it was imported for
+        target_name = current_target.get()
+        generators = registered_generators
         logger.debug(
-            f"{len(generators)} classes registered as generators for target {target}"
+            "%d classes registered as generators for target %s",
+            len(generators),
+            target_name,
         )
 
+        if os.environ.get("KGENLIB_PARALLEL") == "1" and len(generators) > 1:
+            self._run_generators_in_parallel(generators, target_name)
+            return self.store
+
         for func, params in generators:
-            if params.global_generator:
-                self._run_global_generator(func, params)
-            else:
-                logger.debug(f"Expanding {func.__name__} with params {params}")
-                self.expand_and_run(generator_function=func, generator_params=params)
+            self._run_generator(func, params, target_name)
 
         return self.store
 
-    def _run_global_generator(self, func: Callable, params: GeneratorParams) -> None:
+    def _run_generator(
+        self, func: Callable, params: GeneratorParams, target_name: str = None
+    ) -> None:
+        """Runs one registered generator, global or local."""
+        if params.global_generator:
+            self._run_global_generator(func, params, target_name)
+        else:
+            logger.debug("Expanding %s with params %s", func.__name__, params)
+            self.expand_and_run(
+                generator_function=func,
+                generator_params=params,
+                target_name=target_name,
+            )
+
+    def _run_generators_in_parallel(self, generators: list, target_name: str) -> None:
+        """
+        Runs the registered generators in a thread pool (opt-in with KGENLIB_PARALLEL=1).
+
+        Generators loading helm charts or files spend most of their time outside
+        the GIL. Each one runs on a copy of this generator with its own store,
+        sharing the inventories and lookup cache, and the stores are added back
+        in registration order so the output does not depend on scheduling.
+        """
+        workers = []
+        with ThreadPoolExecutor(max_workers=min(32, len(generators))) as executor:
+            futures = []
+            for func, params in generators:
+                worker = copy.copy(self)
+                worker.store = BaseStore()
+                workers.append(worker)
+                # threads do not inherit context variables such as current_target
+                context = contextvars.copy_context()
+                futures.append(
+                    executor.submit(
+                        context.run, worker._run_generator, func, params, target_name
+                    )
+                )
+            for future in futures:
+                future.result()
+
+        for worker in workers:
+            self.store.add_list(worker.store.content_list)
+
+    def _run_global_generator(
+        self, func: Callable, params: GeneratorParams, target_name: str = None
+    ) -> None:
         """
         Runs a generator function globally across all inventories.
 
         Args:
             func (Callable): The generator function to execute.
             params (GeneratorParams): Parameters for the generator function.
+            target_name (str, optional): The current target. Defaults to `current_target`.
         """
         activation_path = params.activation_path
-        if activation_path and findpath(self.inventory.parameters, activation_path):
+        # global generators often share an activation path: look it up once
+        if activation_path and self._findpath(
+            self.inventory.parameters,
+            activation_path,
+            keys=_split_path(activation_path),
+        ):
             logger.debug(
-                f"Running global generator {func.__name__} with activation path {activation_path}"
+                "Running global generator %s with activation path %s",
+                func.__name__,
+                activation_path,
             )
             for _, inventory in self.global_inventory.items():
                 self.expand_and_run(
                     generator_function=func,
                     generator_params=params,
                     inventory=inventory,
+                    target_name=target_name,
                 )
         else:
             logger.debug(
-                f"Skipping global generator {func.__name__} with params {params}"
+                "Skipping global generator %s with params %s", func.__name__, params
             )
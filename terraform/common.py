@@ -4,7 +4,6 @@ import string
 from enum import StrEnum, auto
 
 from kapitan.inputs.kadet import Dict, load_from_search_paths
-from kapitan.utils import prune_empty
 from pydantic import field_validator
 
 kgenlib = load_from_search_paths("kgenlib")
@@ -65,7 +64,7 @@ class TerraformStore(kgenlib.BaseStore):
 
             filename = output_format.format(content=content)
             if content.prune:
-                content.root = Dict(prune_empty(content.root))
+                kgenlib.prune_in_place(content.root)
             self.root.setdefault(filename, Dict()).merge_update(
                 content.root, box_merge_lists="extend"
             )